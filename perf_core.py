@@ -0,0 +1,249 @@
+"""Shared performance core for the dashboard scripts.
+
+Holds the ISA atmosphere model, the aircraft configuration, and the
+cached derived-quantity functions so every dashboard reuses one JIT
+warmup and one st.cache_data store instead of redefining them.
+"""
+
+import functools
+import math
+from dataclasses import dataclass
+
+import streamlit as st
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to plain Python (same effect as
+    # running with NUMBA_DISABLE_JIT=1)
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# ============================================================
+# PHYSICAL CONSTANTS
+# ============================================================
+
+g = 9.81
+FT_TO_M = 0.3048
+
+# Sea-level ISA values are fixed; fold them at import instead of calling isa(0)
+RHO0 = 1.225
+A0 = 340.294
+
+# ============================================================
+# AIRCRAFT CONFIGURATION
+# ============================================================
+
+@dataclass(frozen=True)
+class AircraftConfig:
+    """Fixed airframe/engine data consumed by the performance math."""
+    MTOW: float
+    OEW: float
+    MaxFuel: float
+    S: float
+    Wingspan: float
+    Length: float
+    CD0: float
+    K: float
+    CLmax_TO: float
+    CLmax_L: float
+    thrust_SL: float
+    TSFC_hr: float
+    MaxMach: float
+    ServiceCeiling: float
+    DesignRange: float
+
+    @property
+    def TSFC_sec(self):
+        return self.TSFC_hr/3600
+
+B777_300 = AircraftConfig(
+    MTOW=299000,
+    OEW=168000,
+    MaxFuel=145000,
+    S=427,
+    Wingspan=64.8,
+    Length=73.9,
+    CD0=0.018,
+    K=0.045,
+    CLmax_TO=1.6,
+    CLmax_L=2.2,
+    thrust_SL=800000,
+    TSFC_hr=0.6,
+    MaxMach=0.89,
+    ServiceCeiling=43000,
+    DesignRange=11000,
+)
+
+# ============================================================
+# ISA ATMOSPHERE
+# ============================================================
+
+@njit(cache=True)
+def _isa_scalar(h):
+    T0=288.15; P0=101325; L=-0.0065; R=287
+    if h<=11000:
+        T=T0+L*h; P=P0*(T/T0)**(-g/(L*R))
+    else:
+        T=216.65; P=22632*math.exp(-g*(h-11000)/(R*T))
+    rho=P/(R*T)
+    a=math.sqrt(1.4*R*T)
+    return rho,a
+
+# lru_cache can't sit on the jitted function itself, so memoize at the
+# Python boundary: the 1 ft slider step yields a small set of repeating
+# altitudes, and repeats become a dict lookup instead of a native call
+@functools.lru_cache(maxsize=4096)
+def isa(h):
+    return _isa_scalar(float(h))
+
+# Warm the JIT cache at import so the first slider move doesn't pay
+# the compile cost
+isa(0.0)
+
+def isa_vec(h):
+    """Vectorized isa() for array altitudes; one pass in NumPy's C layer."""
+    T0=288.15; P0=101325; L=-0.0065; R=287
+    T = np.where(h<=11000, T0+L*h, 216.65)
+    P = np.where(h<=11000, P0*(T/T0)**(-g/(L*R)), 22632*np.exp(-g*(h-11000)/(R*T)))
+    rho = P/(R*T)
+    a = np.sqrt(1.4*R*T)
+    return rho,a
+
+# Altitude grid for the ceiling sweep; allocated once, not per rerun
+H_GRID = np.linspace(0, 15000, 200)
+
+# Mach sweep for the thrust curve; allocated once, not per rerun
+M_RANGE = np.linspace(0, 0.9, 100)
+
+def thrust_model(thrust_sl, rho, Mach):
+    """Thrust available from sea-level thrust, density, and Mach.
+
+    Pure ufunc arithmetic: rho and Mach may be scalars or arrays, so
+    altitude/Mach sweeps evaluate in one expression instead of a call
+    per grid point.
+    """
+    return thrust_sl*(rho/RHO0)**0.8*(1-0.25*Mach)
+
+# ============================================================
+# PERFORMANCE MODEL
+# ============================================================
+
+@st.cache_data(max_entries=128)
+def compute_all(mass, altitude_ft, Mach, fuel_fraction, cfg=B777_300):
+    """All derived performance quantities for one flight condition.
+
+    Pure function of the slider inputs and configuration, so
+    st.cache_data turns repeated slider positions into dictionary
+    lookups instead of recomputing the whole numeric block per rerun.
+    """
+    Wi = mass
+    Wf = mass / fuel_fraction
+
+    rho,a = isa(altitude_ft*FT_TO_M)
+    V = Mach*a
+    W = mass*g
+
+    # Aerodynamics
+    q = 0.5*rho*V*V
+    CL = W/(q*cfg.S)
+    CD = cfg.CD0 + cfg.K*CL*CL
+
+    Lift = q*cfg.S*CL
+    Drag = q*cfg.S*CD
+    LD = CL/CD
+
+    # Thrust & power
+    Thrust_available = thrust_model(cfg.thrust_SL, rho, Mach)
+    Thrust_required = Drag
+
+    Power_required = Thrust_required * V
+    Power_available = Thrust_available * V
+
+    ROC = (Thrust_available - Thrust_required)*V/W
+
+    # Takeoff & landing
+    W0 = mass*g
+
+    V_stall_TO = math.sqrt(2*W0/(RHO0*cfg.S*cfg.CLmax_TO))
+    V2 = 1.2 * V_stall_TO
+
+    mu_roll = 0.02
+    q_TO = 0.5*RHO0*V2*V2*cfg.S
+    CL_TO = W0/q_TO
+    Drag_TO = q_TO*(cfg.CD0 + cfg.K*CL_TO*CL_TO)
+    Net_force = cfg.thrust_SL - Drag_TO - mu_roll*W0
+    a_TO = Net_force/mass
+    S_takeoff = V2*V2/(2*a_TO)
+
+    Landing_weight = 0.85 * mass
+    W_land = Landing_weight * g
+    V_stall_L = math.sqrt(2*W_land/(RHO0*cfg.S*cfg.CLmax_L))
+    V_app = 1.3 * V_stall_L
+    a_brake = 0.3 * g
+    S_landing = V_app*V_app/(2*a_brake)
+
+    # Range & endurance share the Breguet kernel; Range is just the
+    # endurance integral times V
+    breguet = math.log(Wi/Wf) * LD / cfg.TSFC_sec
+    Endurance = breguet
+    Range = breguet * V
+
+    return {
+        "V": V,
+        "Lift": Lift,
+        "Drag": Drag,
+        "LD": LD,
+        "Thrust_available": Thrust_available,
+        "Thrust_required": Thrust_required,
+        "Power_required": Power_required,
+        "Power_available": Power_available,
+        "ROC": ROC,
+        "S_takeoff": S_takeoff,
+        "S_landing": S_landing,
+        "Range": Range,
+        "Endurance": Endurance,
+    }
+
+@st.cache_data(max_entries=128)
+def compute_ceiling(mass, Mach, cfg=B777_300):
+    """Service ceiling in ft: first grid altitude where ROC drops to zero.
+
+    One vectorized sweep over H_GRID instead of a 200-step Python loop.
+    """
+    rho_arr, a_arr = isa_vec(H_GRID)
+    V_arr = Mach*a_arr
+    W = mass*g
+    q_arr = 0.5*rho_arr*V_arr**2
+    CL_arr = W/(q_arr*cfg.S)
+    Drag_arr = q_arr*cfg.S*(cfg.CD0 + cfg.K*CL_arr**2)
+    TA_arr = thrust_model(cfg.thrust_SL, rho_arr, Mach)
+    ROC_arr = (TA_arr - Drag_arr)*V_arr/W
+    idx = np.argmax(ROC_arr <= 0)
+    if idx == 0 and ROC_arr[0] > 0:
+        return H_GRID[-1]/FT_TO_M
+    return H_GRID[idx]/FT_TO_M
+
+@st.cache_data(max_entries=128)
+def time_to_climb(mass, Mach, h1_ft, h2_ft, cfg=B777_300):
+    """Minutes to climb between two altitudes: trapezoidal integral of 1/ROC.
+
+    Same vectorized template as compute_ceiling; np.trapezoid replaces a
+    per-step Python integration loop.
+    """
+    h_m = np.linspace(h1_ft, h2_ft, 100) * FT_TO_M
+    rho_arr, a_arr = isa_vec(h_m)
+    V_arr = Mach*a_arr
+    W = mass*g
+    q_arr = 0.5*rho_arr*V_arr**2
+    CL_arr = W/(q_arr*cfg.S)
+    Drag_arr = q_arr*cfg.S*(cfg.CD0 + cfg.K*CL_arr**2)
+    TA_arr = thrust_model(cfg.thrust_SL, rho_arr, Mach)
+    ROC_arr = (TA_arr - Drag_arr)*V_arr/W
+    mask = ROC_arr > 0
+    if not mask.any():
+        return float("inf")
+    return np.trapezoid(1.0/ROC_arr[mask], h_m[mask])/60